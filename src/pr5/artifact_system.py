@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from itertools import compress
 from typing import Any, Dict, List
 
 
@@ -9,10 +10,24 @@ class ArtifactProcessor:
 
     Хранит артефакты в виде словарей:
       {"name": str, "power": int|float, "type": "magical"|"normal"}
+
+    Параллельно со словарями ведётся плоский список сил (SoA), индекс
+    самого сильного артефакта и списки артефактов по типам, поэтому
+    агрегаты считаются без обхода всех словарей.
+
+    Поэтому список artifacts и возвращаемые словари доступны только для
+    чтения: изменять их можно лишь через методы класса, иначе индексы
+    (например, самого сильного артефакта) разойдутся с данными.
     """
 
     def __init__(self):
         self.artifacts: List[Dict[str, Any]] = []
+        self._powers: List[int | float] = []
+        self._max_idx: int = -1
+        # Сколько артефактов с каждым именем: промах remove_artifact за O(1)
+        self._by_name: Dict[str, int] = {}
+        # Индекс по типу: списки артефактов в порядке добавления
+        self._by_type: Dict[str, List[Dict[str, Any]]] = {"magical": [], "normal": []}
 
     def add_artifact(self, name, power_level, is_magical):
         """Добавляет артефакт в хранилище.
@@ -22,10 +37,12 @@ class ArtifactProcessor:
         - power_level: число > 0
         - type зависит от is_magical
         """
-        if name is None or not isinstance(name, str) or not name.strip():
+        # isspace() проверяет пробельность без создания копии, как strip()
+        if not isinstance(name, str) or not name or name.isspace():
             raise ValueError("name must be a non-empty string")
 
-        if not isinstance(power_level, (int, float)):
+        t = type(power_level)
+        if t is not int and t is not float and not isinstance(power_level, (int, float)):
             raise TypeError("power_level must be a number")
 
         if power_level <= 0:
@@ -36,12 +53,19 @@ class ArtifactProcessor:
             "power": power_level,
             "type": "magical" if bool(is_magical) else "normal",
         }
+        # Строгое сравнение: при равной силе остаётся первый добавленный
+        if self._max_idx < 0 or power_level > self._powers[self._max_idx]:
+            self._max_idx = len(self._powers)
         self.artifacts.append(artifact)
+        self._powers.append(power_level)
+        self._by_name[name] = self._by_name.get(name, 0) + 1
+        self._by_type[artifact["type"]].append(artifact)
         return artifact
 
     def calculate_total_power(self):
         """Считает суммарную магическую силу ТОЛЬКО magical-артефактов."""
-        return sum(art["power"] for art in self.artifacts if art.get("type") == "magical")
+        # sum() компенсирует ошибку округления float, поэтому без накопленной суммы
+        return sum(a["power"] for a in self._by_type["magical"])
 
     def get_most_powerful(self):
         """Возвращает самый сильный артефакт.
@@ -52,11 +76,7 @@ class ArtifactProcessor:
         if not self.artifacts:
             return None
 
-        max_art = self.artifacts[0]
-        for art in self.artifacts[1:]:
-            if art["power"] > max_art["power"]:
-                max_art = art
-        return max_art
+        return self.artifacts[self._max_idx]
 
     def remove_artifact(self, name):
         """Удаляет ВСЕ артефакты с данным именем.
@@ -66,14 +86,33 @@ class ArtifactProcessor:
         if name is None:
             raise ValueError("name must not be None")
 
-        before = len(self.artifacts)
-        self.artifacts = [a for a in self.artifacts if a.get("name") != name]
-        return before - len(self.artifacts)
-
-    def get_artifacts_by_type(self, artifact_type):
-        """Фильтрует артефакты по типу, без чувствительности к регистру.
-
-        Если тип неизвестен/не найден — возвращает [].
+        # Сохраняются только строковые имена; прочие значения совпасть не могут
+        if not isinstance(name, str):
+            return 0
+
+        removed = self._by_name.pop(name, 0)
+        if not removed:
+            return 0
+
+        keep = [a.get("name") != name for a in self.artifacts]
+        self.artifacts = list(compress(self.artifacts, keep))
+        self._powers = list(compress(self._powers, keep))
+        # max и index возвращают первое вхождение максимума
+        self._max_idx = self._powers.index(max(self._powers)) if self._powers else -1
+        for key, bucket in self._by_type.items():
+            self._by_type[key] = [a for a in bucket if a.get("name") != name]
+        return removed
+
+    def iter_artifacts_by_type(self, artifact_type):
+        """Итератор по артефактам данного типа, без чувствительности к регистру.
+
+        Не создаёт промежуточный список; тип проверяется сразу при вызове.
+        Если тип неизвестен/не найден — итератор пуст.
+
+        Итератор идёт по внутреннему списку, поэтому во время обхода нельзя
+        вызывать add_artifact/remove_artifact: добавленные артефакты могут
+        попасть в обход, а удалённые — остаться в нём. Для снимка используйте
+        get_artifacts_by_type.
         """
         if artifact_type is None or not isinstance(artifact_type, str):
             raise ValueError("artifact_type must be a string")
@@ -82,4 +121,11 @@ class ArtifactProcessor:
         if not key:
             raise ValueError("artifact_type must be non-empty")
 
-        return [a for a in self.artifacts if str(a.get("type", "")).lower() == key]
+        return iter(self._by_type.get(key, ()))
+
+    def get_artifacts_by_type(self, artifact_type):
+        """Фильтрует артефакты по типу, без чувствительности к регистру.
+
+        Если тип неизвестен/не найден — возвращает [].
+        """
+        return list(self.iter_artifacts_by_type(artifact_type))
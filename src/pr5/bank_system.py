@@ -1,11 +1,28 @@
 from __future__ import annotations
 
+import math
 from decimal import Decimal, ROUND_HALF_UP
+from enum import IntEnum
+from fractions import Fraction
 from typing import Dict, List, Optional, Tuple
 
 
-SUPPORTED_CURRENCIES = {"RUB", "USD", "EUR", "GBP"}
+class Currency(IntEnum):
+    """Внутренние коды поддерживаемых валют"""
+
+    RUB = 0
+    USD = 1
+    EUR = 2
+    GBP = 3
+
+
+SUPPORTED_CURRENCIES = {c.name for c in Currency}
+# Строка валюты переводится в код один раз на границе API
+_CURRENCY_CODES: Dict[str, int] = {c.name: c.value for c in Currency}
+_CURRENCY_NAMES: Tuple[str, ...] = tuple(c.name for c in Currency)
 _MONEY_Q = Decimal("0.01")
+_FEE_PERCENT = 1
+_ZERO = Decimal("0.00")
 
 
 def _to_decimal_money(value) -> Decimal:
@@ -15,18 +32,68 @@ def _to_decimal_money(value) -> Decimal:
     - Принимает int / float / Decimal
     - Округляет используя ROUND_HALF_UP
     """
-    if isinstance(value, bool):
-        raise TypeError("amount должен быть числом")
-    if not isinstance(value, (int, float, Decimal)):
-        raise TypeError("amount должен быть числом")
+    t = type(value)
+    # Быстрая проверка точного типа; isinstance — только для подклассов
+    if t is not int and t is not float and t is not Decimal:
+        if t is bool or not isinstance(value, (int, float, Decimal)):
+            raise TypeError("amount должен быть числом")
+    if t is Decimal:
+        # Decimal округляется напрямую, без повторного разбора через str()
+        return value.quantize(_MONEY_Q, rounding=ROUND_HALF_UP)
+    if t is int:
+        return Decimal(value).quantize(_MONEY_Q)
     return Decimal(str(value)).quantize(_MONEY_Q, rounding=ROUND_HALF_UP)
 
 
+def _to_cents(value) -> int:
+    """Преобразует введённое значение в целое число копеек (правила как в _to_decimal_money)."""
+    return int(_to_decimal_money(value).scaleb(2))
+
+
+def _to_limit_cents(value) -> int | float:
+    """Переводит лимит в копейки с округлением вниз, чтобы лимит не вырос.
+
+    Бесконечный лимит возвращается как ±math.inf: с int он сравнивается корректно.
+    """
+    try:
+        return math.floor(Fraction(value) * 100)
+    except OverflowError:
+        return math.inf if value > 0 else -math.inf
+
+
+def _from_cents(cents: int) -> Decimal:
+    """Преобразует целое число копеек обратно в денежное десятичное."""
+    return Decimal(cents).scaleb(-2)
+
+
+# История операций хранится кортежами (код, *аргументы), а строки
+# собираются только при чтении истории
+_TX_FORMATS = {
+    "DEP": lambda amount_c, ccode: f"+{_from_cents(amount_c)} {_CURRENCY_NAMES[ccode]}",
+    "WDR": lambda amount_c, fee_c, ccode: (
+        f"-{_from_cents(amount_c)} (комиссия: {_from_cents(fee_c)}) {_CURRENCY_NAMES[ccode]}"
+    ),
+    "CNV": lambda ccode: f"Конвертировать в {_CURRENCY_NAMES[ccode]}",
+    "OUT": lambda amount_c, ccode, owner: (
+        f"Передача -{_from_cents(amount_c)} {_CURRENCY_NAMES[ccode]} в {owner}"
+    ),
+    "IN": lambda amount_c, ccode, owner: (
+        f"Передача +{_from_cents(amount_c)} {_CURRENCY_NAMES[ccode]} от {owner}"
+    ),
+}
+
+
+def _format_transaction(record: Tuple) -> str:
+    return _TX_FORMATS[record[0]](*record[1:])
+
+
 class CurrencyConverter:
     """Простой конвертер валют"""
 
+    __slots__ = ("_rates",)
+
     def __init__(self, rates: Optional[Dict[Tuple[str, str], Decimal]] = None):
-        self._rates: Dict[Tuple[str, str], Decimal] = rates or {
+        rates = rates or {
             ("RUB", "USD"): Decimal("0.01"),
             ("USD", "RUB"): Decimal("100"),
             ("RUB", "EUR"): Decimal("0.0090909091"),
@@ -34,11 +101,20 @@ class CurrencyConverter:
             ("RUB", "GBP"): Decimal("0.0076923077"),
             ("GBP", "RUB"): Decimal("130"),
         }
+        # Таблица курсов [from][to] по кодам валют; None — курса нет
+        size = len(_CURRENCY_NAMES)
+        self._rates: List[List[Optional[Decimal]]] = [[None] * size for _ in range(size)]
+        for (from_currency, to_currency), rate in rates.items():
+            from_code = _CURRENCY_CODES.get(from_currency)
+            to_code = _CURRENCY_CODES.get(to_currency)
+            if from_code is None or to_code is None:
+                raise ValueError("Неподдерживаемая валюта")
+            self._rates[from_code][to_code] = rate
 
     def convert(self, amount: Decimal, from_currency: str, to_currency: str) -> Decimal:
-        if from_currency not in SUPPORTED_CURRENCIES:
-            raise ValueError("Неподдерживаемая валюта")
-        if to_currency not in SUPPORTED_CURRENCIES:
+        from_code = _CURRENCY_CODES.get(from_currency)
+        to_code = _CURRENCY_CODES.get(to_currency)
+        if from_code is None or to_code is None:
             raise ValueError("Неподдерживаемая валюта")
 
         if not isinstance(amount, Decimal):
@@ -46,34 +122,89 @@ class CurrencyConverter:
 
         amount = amount.quantize(_MONEY_Q, rounding=ROUND_HALF_UP)
 
-        if from_currency == to_currency:
+        if from_code == to_code:
             return amount
 
-        key = (from_currency, to_currency)
-        if key not in self._rates:
+        rate = self._rates[from_code][to_code]
+        if rate is None:
             raise ValueError(f"Неподдерживаемая конвертация: {from_currency}->{to_currency}")
 
-        return (amount * self._rates[key]).quantize(_MONEY_Q, rounding=ROUND_HALF_UP)
+        return (amount * rate).quantize(_MONEY_Q, rounding=ROUND_HALF_UP)
+
+
+# Конвертер по умолчанию не хранит изменяемого состояния, поэтому общий
+_DEFAULT_CONVERTER = CurrencyConverter()
 
 
 class BankAccount:
-    """Bank account с поддержкой множества валют и историей транзакций"""
+    """Bank account с поддержкой множества валют и историей транзакций
+
+    Баланс и лимит овердрафта хранятся в целых копейках, валюта — кодом
+    Currency; Decimal и строки появляются только на границе API
+    (свойства balance, overdraft_limit и currency).
+    """
+
+    __slots__ = ("owner", "_cents", "_ccode", "_pending", "_rendered", "is_blocked",
+                 "_overdraft_limit", "_overdraft_cents")
 
     MAX_DEPOSIT = Decimal("1000000.00")
 
     def __init__(self, owner: str, balance=0, currency: str = "RUB"):
         if not isinstance(owner, str) or not owner.strip():
             raise ValueError("owner должен быть не пустой строкой")
-        if currency not in SUPPORTED_CURRENCIES:
+        ccode = _CURRENCY_CODES.get(currency)
+        if ccode is None:
             raise ValueError("Неподдерживаемая валюта")
 
         self.owner = owner
-        self.balance: Decimal = _to_decimal_money(balance)
-        self.currency = currency
+        self._cents: int = _to_cents(balance)
+        self._ccode: int = ccode
 
-        self.transactions: List[str] = []
+        # Каждая операция хранится один раз: сначала записью в _pending,
+        # после первого чтения истории — строкой в кортеже _rendered
+        self._pending: List[Tuple] = []
+        self._rendered: Tuple[str, ...] = ()
         self.is_blocked = False
-        self.overdraft_limit: Decimal = Decimal("0.00")
+        self._overdraft_limit = _ZERO
+        self._overdraft_cents: int | float = 0
+
+    @property
+    def balance(self) -> Decimal:
+        return _from_cents(self._cents)
+
+    @balance.setter
+    def balance(self, value) -> None:
+        # Баланс хранится в копейках и округляется так же, как в конструкторе
+        self._cents = _to_cents(value)
+
+    @property
+    def currency(self) -> str:
+        return _CURRENCY_NAMES[self._ccode]
+
+    @currency.setter
+    def currency(self, value: str) -> None:
+        ccode = _CURRENCY_CODES.get(value)
+        if ccode is None:
+            raise ValueError("Неподдерживаемая валюта")
+        self._ccode = ccode
+
+    @property
+    def overdraft_limit(self):
+        return self._overdraft_limit
+
+    @overdraft_limit.setter
+    def overdraft_limit(self, value) -> None:
+        # Лимит хранится как задан; для проверок — целые копейки, округлённые вниз
+        self._overdraft_cents = _to_limit_cents(value)
+        self._overdraft_limit = value
+
+    @property
+    def transactions(self) -> Tuple[str, ...]:
+        """История операций в виде строк (неизменяемый кортеж; новые записи форматируются при обращении)"""
+        if self._pending:
+            self._rendered += tuple(map(_format_transaction, self._pending))
+            self._pending.clear()
+        return self._rendered
 
     def deposit(self, amount):
         """Депозит на счёт"""
@@ -83,8 +214,9 @@ class BankAccount:
         if amount_d > self.MAX_DEPOSIT:
             raise ValueError("Депозит слишком велик")
 
-        self.balance = (self.balance + amount_d).quantize(_MONEY_Q, rounding=ROUND_HALF_UP)
-        self.transactions.append(f"+{amount_d} {self.currency}")
+        amount_c = int(amount_d.scaleb(2))
+        self._cents += amount_c
+        self._pending.append(("DEP", amount_c, self._ccode))
         return self.balance
 
     def withdraw(self, amount):
@@ -96,25 +228,27 @@ class BankAccount:
         if amount_d <= 0:
             raise ValueError("Снятие должно быть позитивным")
 
-        fee = (amount_d * Decimal("0.01")).quantize(_MONEY_Q, rounding=ROUND_HALF_UP)
-        total = amount_d + fee
-
-        if self.balance - total < -self.overdraft_limit:
+        amount_c = int(amount_d.scaleb(2))
+        # 1% с ROUND_HALF_UP до копейки (суммы здесь всегда положительные)
+        fee_c = (amount_c * _FEE_PERCENT + 50) // 100
+        new_c = self._cents - amount_c - fee_c
+        if new_c < -self._overdraft_cents:
             raise ValueError("Недостаток средств")
 
-        self.balance = (self.balance - total).quantize(_MONEY_Q, rounding=ROUND_HALF_UP)
-        self.transactions.append(f"-{amount_d} (комиссия: {fee}) {self.currency}")
+        self._cents = new_c
+        self._pending.append(("WDR", amount_c, fee_c, self._ccode))
         return amount_d
 
     def convert_to(self, target_currency: str, converter: Optional[CurrencyConverter] = None):
         """Конвертация денег с одной валюты в другую"""
-        if target_currency not in SUPPORTED_CURRENCIES:
+        target_code = _CURRENCY_CODES.get(target_currency)
+        if target_code is None:
             raise ValueError("Неподдерживаемая валюта")
-        converter = converter or CurrencyConverter()
-
-        self.balance = converter.convert(self.balance, self.currency, target_currency)
-        self.currency = target_currency
-        self.transactions.append(f"Конвертировать в {target_currency}")
+        if target_code != self._ccode:
+            converter = converter or _DEFAULT_CONVERTER
+            self.balance = converter.convert(self.balance, self.currency, target_currency)
+            self._ccode = target_code
+        self._pending.append(("CNV", target_code))
         return self.balance
 
     def get_statement(self):
@@ -123,7 +257,7 @@ class BankAccount:
             "owner": self.owner,
             "currency": self.currency,
             "balance": self.balance,
-            "transactions": list(self.transactions),
+            "transactions": self.transactions,
             "is_blocked": self.is_blocked,
         }
 
@@ -143,24 +277,31 @@ class BankAccount:
         if amount_d <= 0:
             raise ValueError("Количество передаваемых денег должно быть позитивным")
 
-        converter = converter or CurrencyConverter()
-
-        if self.balance - amount_d < -self.overdraft_limit:
+        amount_c = int(amount_d.scaleb(2))
+        new_c = self._cents - amount_c
+        if new_c < -self._overdraft_cents:
             raise ValueError("Недостаток средств")
 
-        credited = converter.convert(amount_d, self.currency, target_account.currency)
+        if target_account._ccode == self._ccode:
+            credited, credited_c = amount_d, amount_c
+        else:
+            converter = converter or _DEFAULT_CONVERTER
+            credited = converter.convert(amount_d, self.currency, target_account.currency)
+            credited_c = _to_cents(credited)
 
-        self.balance = (self.balance - amount_d).quantize(_MONEY_Q, rounding=ROUND_HALF_UP)
-        target_account.balance = (target_account.balance + credited).quantize(_MONEY_Q, rounding=ROUND_HALF_UP)
+        self._cents = new_c
+        target_account._cents += credited_c
 
-        self.transactions.append(f"Передача -{amount_d} {self.currency} в {target_account.owner}")
-        target_account.transactions.append(f"Передача +{credited} {target_account.currency} от {self.owner}")
+        self._pending.append(("OUT", amount_c, self._ccode, target_account.owner))
+        target_account._pending.append(("IN", credited_c, target_account._ccode, self.owner))
         return credited
 
 
 class Bank:
     """Банк управляющий множеством аккаунтов"""
 
+    __slots__ = ("name", "accounts")
+
     def __init__(self, name: str):
         if not isinstance(name, str) or not name.strip():
             raise ValueError("name должно быть не пустой строкой")
@@ -168,21 +309,27 @@ class Bank:
         self.accounts: Dict[str, BankAccount] = {}
 
     def create_account(self, owner: str, initial_balance=0, currency: str = "RUB"):
-        if owner in self.accounts:
+        accounts = self.accounts
+        if owner in accounts:
             raise ValueError("Такой аккаунт уже существует")
-        account = BankAccount(owner, initial_balance, currency)
-        self.accounts[owner] = account
+        account = accounts[owner] = BankAccount(owner, initial_balance, currency)
         return account
 
     def total_deposits(self, currency: str = "RUB", converter: Optional[CurrencyConverter] = None):
-        if currency not in SUPPORTED_CURRENCIES:
+        ccode = _CURRENCY_CODES.get(currency)
+        if ccode is None:
             raise ValueError("Неподдерживаемая валюта")
-        converter = converter or CurrencyConverter()
+        converter = converter or _DEFAULT_CONVERTER
 
-        total = Decimal("0.00")
+        # Счета в целевой валюте суммируются в копейках без конвертера
+        same_c = 0
+        total = _ZERO
         for acc in self.accounts.values():
             if acc.is_blocked:
                 continue
-            total += converter.convert(acc.balance, acc.currency, currency)
+            if acc._ccode == ccode:
+                same_c += acc._cents
+            else:
+                total += converter.convert(acc.balance, acc.currency, currency)
 
-        return total.quantize(_MONEY_Q, rounding=ROUND_HALF_UP)
+        return (total + _from_cents(same_c)).quantize(_MONEY_Q, rounding=ROUND_HALF_UP)
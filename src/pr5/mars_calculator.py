@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from math import prod
+from math import factorial as _math_factorial
+
+# Допустимая область factorial — всего 11 значений, поэтому они считаются заранее
+_FACT = tuple(_math_factorial(i) for i in range(11))
 
 
 class MarsCalculator:
@@ -32,6 +35,4 @@ class MarsCalculator:
             raise ValueError("Факториал отрицательного числа не определен")
         if n > 10:
             raise ValueError("Слишком большое число для бортового компьютера")
-        if n in (0, 1):
-            return 1
-        return prod(range(2, n + 1))
+        return _FACT[n]
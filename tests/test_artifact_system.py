@@ -78,6 +78,8 @@ def test_remove_artifact_not_found_returns_0_and_none_raises():
     ap = ArtifactProcessor()
     ap.add_artifact("A", 1, True)
     assert ap.remove_artifact("B") == 0
+    assert ap.remove_artifact(["A"]) == 0  # нехешируемое имя
+    assert ap.remove_artifact(1) == 0
     with pytest.raises(ValueError):
         ap.remove_artifact(None)
 
@@ -114,3 +116,61 @@ def test_add_artifact_allows_float_power_if_positive():
     art = ap.add_artifact("Floaty", 1.5, True)
     assert art["power"] == 1.5
     assert art["type"] == "magical"
+
+
+def test_remove_artifact_keeps_aggregates_in_sync():
+    ap = ArtifactProcessor()
+    ap.add_artifact("A", 10, True)
+    ap.add_artifact("B", 20, False)
+    ap.add_artifact("C", 7, True)
+    ap.remove_artifact("A")
+    assert ap.calculate_total_power() == 7
+    assert [a["name"] for a in ap.get_artifacts_by_type("magical")] == ["C"]
+    assert [a["name"] for a in ap.get_artifacts_by_type("normal")] == ["B"]
+
+
+def test_remove_artifact_twice_second_call_returns_0():
+    ap = ArtifactProcessor()
+    ap.add_artifact("Dup", 1, True)
+    ap.add_artifact("Dup", 2, True)
+    assert ap.remove_artifact("Dup") == 2
+    assert ap.remove_artifact("Dup") == 0
+    ap.add_artifact("Dup", 3, False)
+    assert ap.remove_artifact("Dup") == 1
+    assert ap.artifacts == []
+
+
+def test_get_most_powerful_after_removing_strongest():
+    ap = ArtifactProcessor()
+    a = ap.add_artifact("A", 5, True)
+    ap.add_artifact("Big", 50, False)
+    ap.add_artifact("C", 5, True)
+    ap.remove_artifact("Big")
+    assert ap.get_most_powerful() is a
+    ap.remove_artifact("A")
+    ap.remove_artifact("C")
+    assert ap.get_most_powerful() is None
+
+
+def test_iter_artifacts_by_type_is_lazy_and_validates_eagerly():
+    ap = ArtifactProcessor()
+    a = ap.add_artifact("A", 1, True)
+    ap.add_artifact("B", 2, False)
+
+    it = ap.iter_artifacts_by_type("Magical")
+    assert next(it) is a
+    assert next(it, None) is None
+    assert list(ap.iter_artifacts_by_type("unknown")) == []
+    with pytest.raises(ValueError):
+        ap.iter_artifacts_by_type("  ")
+
+
+def test_calculate_total_power_float_sum_is_exact():
+    ap = ArtifactProcessor()
+    for i in range(10):
+        ap.add_artifact(f"F{i}", 0.1, True)
+    assert ap.calculate_total_power() == 1.0
+    ap2 = ArtifactProcessor()
+    for name, power in [("A", 0.1), ("B", 0.2), ("C", 0.3)]:
+        ap2.add_artifact(name, power, True)
+    assert ap2.calculate_total_power() == 0.6
@@ -1,7 +1,7 @@
 import pytest
 from decimal import Decimal
 
-from pr5.bank_system import Bank, BankAccount, CurrencyConverter, _to_decimal_money
+from pr5.bank_system import Bank, BankAccount, Currency, CurrencyConverter, _to_decimal_money
 
 
 @pytest.fixture()
@@ -20,6 +20,12 @@ def test_to_decimal_money_rejects_bool_and_rounds():
     assert _to_decimal_money(1.005) == Decimal("1.01")  # ROUND_HALF_UP
 
 
+def test_to_decimal_money_decimal_inputs():
+    assert _to_decimal_money(Decimal("10.00")) == Decimal("10.00")
+    assert _to_decimal_money(Decimal("2.345")) == Decimal("2.35")
+    assert str(_to_decimal_money(Decimal("3"))) == "3.00"
+
+
 def test_account_init_validates_owner_and_currency():
     with pytest.raises(ValueError):
         BankAccount("", 0, "RUB")
@@ -40,6 +46,18 @@ def test_currency_converter_convert_validates_input():
     assert conv.convert(Decimal("1.23"), "USD", "RUB") == Decimal("123.00")  # quantize
 
 
+def test_currency_codes_stay_strings_at_api_boundary():
+    with pytest.raises(ValueError):
+        CurrencyConverter({("AAA", "RUB"): Decimal("1")})
+    acc = BankAccount("Alice", 0, "EUR")
+    assert acc.currency == "EUR"
+    assert Currency[acc.currency] == Currency.EUR
+    with pytest.raises(ValueError):
+        acc.currency = "AAA"
+    acc.currency = "GBP"
+    assert acc.get_statement()["currency"] == "GBP"
+
+
 def test_deposit_rejects_negative_zero_non_number_and_too_large():
     acc = BankAccount("Alice", 0, "RUB")
     with pytest.raises(ValueError):
@@ -83,6 +101,42 @@ def test_withdraw_checks_funds_and_fee():
     assert acc.transactions[-1] == "-10.00 (комиссия: 0.10) RUB"
 
 
+def test_withdraw_fee_rounds_half_up():
+    acc = BankAccount("Alice", 10, "RUB")
+    acc.withdraw(Decimal("0.50"))  # комиссия 0.005 -> 0.01
+    assert acc.balance == Decimal("9.49")
+    acc.withdraw(Decimal("0.49"))  # комиссия 0.0049 -> 0.00
+    assert acc.balance == Decimal("9.00")
+
+
+def test_withdraw_allows_overdraft_within_limit():
+    acc = BankAccount("Alice", 0, "RUB")
+    acc.overdraft_limit = 20
+    assert acc.overdraft_limit == Decimal("20.00")
+    acc.withdraw(10)
+    assert acc.balance == Decimal("-10.10")
+    with pytest.raises(ValueError):
+        acc.withdraw(10)  # -20.20 < -20.00
+
+
+@pytest.mark.parametrize("limit", [0.005, Decimal("0.005"), Decimal("0.009")])
+def test_overdraft_limit_is_never_rounded_up(limit):
+    acc = BankAccount("Alice", 0, "RUB")
+    acc.overdraft_limit = limit
+    assert acc.overdraft_limit == limit
+    with pytest.raises(ValueError):
+        acc.withdraw(Decimal("0.01"))
+    assert acc.balance == Decimal("0.00")
+
+
+@pytest.mark.parametrize("limit", [Decimal("Infinity"), float("inf"), 10**30])
+def test_overdraft_limit_unlimited(limit):
+    acc = BankAccount("Alice", 0, "RUB")
+    acc.overdraft_limit = limit
+    acc.withdraw(1000)
+    assert acc.balance == Decimal("-1010.00")
+
+
 def test_withdraw_insufficient_funds():
     acc = BankAccount("Alice", 10, "RUB")
     with pytest.raises(ValueError):
@@ -104,10 +158,29 @@ def test_get_statement_is_snapshot_copy():
     st = acc.get_statement()
     assert st["owner"] == "Alice"
     assert st["balance"] == Decimal("1.00")
-    assert st["transactions"] == ["+1.00 RUB"]
-    st["transactions"].append("HACK")
+    assert st["transactions"] == ("+1.00 RUB",)
+    with pytest.raises(AttributeError):
+        st["transactions"].append("HACK")
     # внутренний список не должен измениться
-    assert acc.transactions == ["+1.00 RUB"]
+    assert acc.transactions == ("+1.00 RUB",)
+
+
+def test_transactions_is_read_only():
+    acc = BankAccount("Alice", 0, "RUB")
+    acc.deposit(1)
+    with pytest.raises(AttributeError):
+        acc.transactions.append("manual")
+    with pytest.raises(AttributeError):
+        acc.transactions = []
+    assert acc.transactions == ("+1.00 RUB",)
+
+
+def test_get_statement_includes_operations_after_previous_call():
+    acc = BankAccount("Alice", 0, "RUB")
+    acc.deposit(1)
+    assert acc.get_statement()["transactions"] == ("+1.00 RUB",)
+    acc.deposit(2)
+    assert acc.get_statement()["transactions"] == ("+1.00 RUB", "+2.00 RUB")
 
 
 def test_transfer_validates_target_and_amount():
@@ -148,6 +221,19 @@ def test_transfer_success_different_currency_real_rates():
     assert "Передача +0.10 USD" in acc2.transactions[-1]
 
 
+def test_transfer_same_currency_skips_converter():
+    acc1 = BankAccount("A", 100, "RUB")
+    acc2 = BankAccount("B", 0, "RUB")
+
+    class BadConv(CurrencyConverter):
+        def convert(self, amount, from_currency, to_currency):
+            raise AssertionError("converter must not be called")
+
+    assert acc1.transfer(acc2, 10, converter=BadConv()) == Decimal("10.00")
+    assert acc1.balance == Decimal("90.00")
+    assert acc2.balance == Decimal("10.00")
+
+
 def test_transfer_sender_blocked():
     acc1 = BankAccount("A", 100, "RUB")
     acc2 = BankAccount("B", 0, "RUB")
@@ -171,3 +257,12 @@ def test_total_deposits_skips_blocked_and_converts():
     b.is_blocked = True
     total = bank.total_deposits("RUB", converter=conv)
     assert total == Decimal("10.00")
+
+
+def test_total_deposits_sums_same_and_foreign_currency():
+    conv = CurrencyConverter({("USD", "RUB"): Decimal("100")})
+    bank = Bank("MyBank")
+    bank.create_account("A", 10, "RUB")
+    bank.create_account("B", Decimal("0.55"), "RUB")
+    bank.create_account("C", 2, "USD")
+    assert bank.total_deposits("RUB", converter=conv) == Decimal("210.55")